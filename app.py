@@ -5,6 +5,7 @@ import sys
 import argparse
 import json
 import glob
+import re
 
 # Load environment variables first
 from dotenv import load_dotenv
@@ -35,8 +36,11 @@ app = Flask(__name__)
 # Initialize conversation history
 conversation_history = []
 
-# Initialize database
-db = ConversationDatabase()
+# Words that end the conversation when they appear anywhere in a transcription
+EXIT_COMMAND_PATTERN = re.compile(r'exit|quit', re.IGNORECASE)
+
+# Initialize database; CONVERSATIONS_DB points it elsewhere, e.g. for tests
+db = ConversationDatabase(os.environ.get('CONVERSATIONS_DB', 'conversations.db'))
 
 # Global variable to store the current patient simulation
 current_patient_simulation = None
@@ -186,7 +190,7 @@ def process_audio():
             }), 500
         
         # Check for termination commands
-        if "exit" in transcription.lower() or "quit" in transcription.lower():
+        if EXIT_COMMAND_PATTERN.search(transcription):
             # End conversation in database
             if current_conversation_id:
                 db.end_conversation(current_conversation_id)
@@ -230,8 +234,10 @@ def process_audio():
         
         # Store messages in database
         if current_conversation_id:
-            db.add_message(current_conversation_id, "user", transcription)
-            db.add_message(current_conversation_id, "assistant", response_text)
+            db.add_messages(current_conversation_id, [
+                ("user", transcription),
+                ("assistant", response_text)
+            ])
         
         # Get preferred voice ID from database or use default
         voice_id = db.get_setting('voice_id', 'Fritz-PlayAI')
@@ -262,9 +268,12 @@ def process_audio():
 
 @app.route('/api/conversations', methods=['GET'])
 def list_conversations():
-    """List all conversations"""
+    """List conversations, optionally paginated with ?limit= and ?offset="""
     try:
-        conversations = db.get_all_conversations()
+        conversations = db.get_all_conversations(
+            limit=request.args.get('limit', type=int),
+            offset=request.args.get('offset', 0, type=int)
+        )
         return jsonify({
             'status': 'success',
             'conversations': conversations
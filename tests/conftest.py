@@ -0,0 +1,11 @@
+import os
+import shutil
+import tempfile
+
+# app.py opens its database at import; keep tests away from the repo's conversations.db
+_db_dir = tempfile.mkdtemp()
+os.environ['CONVERSATIONS_DB'] = os.path.join(_db_dir, 'conversations.db')
+
+def pytest_unconfigure(config):
+    """Remove the test database and its WAL files"""
+    shutil.rmtree(_db_dir, ignore_errors=True)
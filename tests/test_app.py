@@ -24,7 +24,10 @@ def temp_db():
     yield test_db
     
     # Clean up
-    os.unlink(path)
+    test_db.close()
+    for suffix in ('', '-wal', '-shm'):
+        if os.path.exists(path + suffix):
+            os.unlink(path + suffix)
 
 def test_list_conversations_empty(client, temp_db):
     """Test listing conversations when none exist"""
@@ -56,6 +59,27 @@ def test_list_conversations_with_data(client, temp_db):
     assert data['conversations'][0][1] == "patient2"  # Most recent first
     assert data['conversations'][1][1] == "patient1"
 
+def test_list_conversations_paginated(client, temp_db):
+    """Test listing one page of conversations, and all of them without paging"""
+    for i in range(5):
+        temp_db.start_conversation(f"patient{i}")
+    
+    with patch('app.db', temp_db):
+        response = client.get('/api/conversations?limit=2&offset=1')
+        data = json.loads(response.data)
+        
+        assert response.status_code == 200
+        assert data['status'] == 'success'
+        assert [conv[1] for conv in data['conversations']] == ["patient3", "patient2"]
+        
+        response = client.get('/api/conversations')
+        data = json.loads(response.data)
+        
+        assert response.status_code == 200
+        assert [conv[1] for conv in data['conversations']] == [
+            "patient4", "patient3", "patient2", "patient1", "patient0"
+        ]
+
 def test_get_conversation(client, temp_db):
     """Test getting a specific conversation"""
     # Replace the app's database with our test database
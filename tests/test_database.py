@@ -1,7 +1,9 @@
 import pytest
 import os
 import tempfile
+import threading
 from datetime import datetime
+from unittest.mock import patch
 from utils.database import ConversationDatabase
 
 @pytest.fixture
@@ -17,7 +19,10 @@ def temp_db():
     yield db
     
     # Clean up
-    os.unlink(path)
+    db.close()
+    for suffix in ('', '-wal', '-shm'):
+        if os.path.exists(path + suffix):
+            os.unlink(path + suffix)
 
 def test_create_tables(temp_db):
     """Test that tables are created correctly"""
@@ -81,6 +86,26 @@ def test_add_message(temp_db):
         assert messages[0] == ("user", "Hello")
         assert messages[1] == ("assistant", "Hi there!")
 
+def test_add_messages(temp_db):
+    """Test adding several messages to a conversation at once"""
+    conv_id = temp_db.start_conversation()
+    
+    temp_db.add_messages(conv_id, [("user", "Hello"), ("assistant", "Hi there!")])
+    
+    conversation = temp_db.get_conversation(conv_id)
+    assert [(msg['role'], msg['content']) for msg in conversation['messages']] == [
+        ("user", "Hello"),
+        ("assistant", "Hi there!")
+    ]
+
+def test_get_conversation_shares_role_strings(temp_db):
+    """Test that loaded messages reuse one string object per role"""
+    conv_id = temp_db.start_conversation()
+    temp_db.add_messages(conv_id, [("user", "Hello"), ("user", "Still there?")])
+    
+    first, second = temp_db.get_conversation(conv_id)['messages']
+    assert first['role'] is second['role']
+
 def test_get_conversation(temp_db):
     """Test retrieving a conversation with its messages"""
     # Start conversation and add messages
@@ -104,6 +129,20 @@ def test_get_conversation(temp_db):
     assert conversation['messages'][1]['role'] == "assistant"
     assert conversation['messages'][1]['content'] == "Hi there!"
 
+def test_get_conversation_without_messages(temp_db):
+    """Test retrieving a conversation that has no messages yet"""
+    conv_id = temp_db.start_conversation("test_patient")
+    
+    conversation = temp_db.get_conversation(conv_id)
+    
+    assert conversation['id'] == conv_id
+    assert conversation['patient_simulation'] == "test_patient"
+    assert conversation['messages'] == []
+
+def test_get_missing_conversation(temp_db):
+    """Test retrieving a conversation that doesn't exist"""
+    assert temp_db.get_conversation(12345) is None
+
 def test_get_all_conversations(temp_db):
     """Test retrieving all conversations"""
     # Create multiple conversations
@@ -118,6 +157,15 @@ def test_get_all_conversations(temp_db):
     assert conversations[0][1] == "patient2"  # Most recent first
     assert conversations[1][1] == "patient1"
 
+def test_get_all_conversations_paginated(temp_db):
+    """Test retrieving one page of conversations"""
+    for i in range(5):
+        temp_db.start_conversation(f"patient{i}")
+    
+    page = temp_db.get_all_conversations(limit=2, offset=1)
+    
+    assert [conv[1] for conv in page] == ["patient3", "patient2"]
+
 def test_delete_conversation(temp_db):
     """Test deleting a conversation and its messages"""
     # Start conversation and add messages
@@ -165,4 +213,112 @@ def test_conversation_with_multiple_messages(temp_db):
     assert len(conversation['messages']) == len(messages)
     for i, (role, content) in enumerate(messages):
         assert conversation['messages'][i]['role'] == role
-        assert conversation['messages'][i]['content'] == content 
\ No newline at end of file
+        assert conversation['messages'][i]['content'] == content
+
+def test_connection_reused_between_calls(temp_db):
+    """Test that consecutive calls share a pooled connection"""
+    with temp_db._connection() as first:
+        pass
+    with temp_db._connection() as second:
+        pass
+    
+    assert first is second
+
+def test_connection_shared_across_threads(temp_db):
+    """Test that pooled connections can be used from other threads"""
+    conv_id = temp_db.start_conversation("test_patient")
+    
+    # Write from a different thread than the one that opened the connection
+    thread = threading.Thread(target=temp_db.add_message, args=(conv_id, "user", "Hello"))
+    thread.start()
+    thread.join()
+    
+    conversation = temp_db.get_conversation(conv_id)
+    assert len(conversation['messages']) == 1
+    assert conversation['messages'][0]['content'] == "Hello"
+
+def test_wal_mode_and_message_index(temp_db):
+    """Test that the database uses WAL and indexes messages by conversation"""
+    with temp_db._connection() as conn:
+        cursor = conn.cursor()
+        
+        cursor.execute("PRAGMA journal_mode")
+        assert cursor.fetchone()[0] == "wal"
+        
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='index' AND name='idx_messages_conversation'")
+        assert cursor.fetchone() is not None
+        
+        # The index should serve per-conversation message lookups
+        cursor.execute(
+            "EXPLAIN QUERY PLAN SELECT role, content, timestamp FROM messages "
+            "WHERE conversation_id = ? ORDER BY timestamp", (1,)
+        )
+        plan = " ".join(str(row[-1]) for row in cursor.fetchall())
+        assert "idx_messages_conversation" in plan
+
+def test_conversation_listing_uses_index(temp_db):
+    """Test that listing conversations newest first needs no sort step"""
+    with temp_db._connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM conversations "
+            "ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?", (10, 0)
+        )
+        plan = " ".join(str(row[-1]) for row in cursor.fetchall())
+        assert "idx_conversations_created" in plan
+        assert "TEMP B-TREE" not in plan
+
+def test_get_setting_default(temp_db):
+    """Test that a missing setting returns the default value"""
+    assert temp_db.get_setting('voice_id', 'Fritz-PlayAI') == 'Fritz-PlayAI'
+
+def test_set_setting_updates_cached_value(temp_db):
+    """Test that changing a setting replaces a previously read value"""
+    assert temp_db.get_setting('voice_id') is None
+    
+    temp_db.set_setting('voice_id', 'Fritz-PlayAI')
+    assert temp_db.get_setting('voice_id') == 'Fritz-PlayAI'
+    
+    temp_db.set_setting('voice_id', 'Celeste-PlayAI')
+    assert temp_db.get_setting('voice_id') == 'Celeste-PlayAI'
+
+def test_get_setting_not_stale_after_concurrent_set(temp_db):
+    """Test that a read racing a write can't leave the old value cached"""
+    read_done = threading.Event()
+    proceed = threading.Event()
+    
+    class PausingCache(dict):
+        # Holds the reader between fetching the row and caching it
+        def __setitem__(self, key, value):
+            if threading.current_thread().name == 'reader':
+                read_done.set()
+                assert proceed.wait(timeout=5)
+            super().__setitem__(key, value)
+    
+    temp_db.set_setting('voice_id', 'Fritz-PlayAI')
+    temp_db._settings_cache = PausingCache()
+    
+    reader = threading.Thread(target=temp_db.get_setting, args=('voice_id',), name='reader')
+    writer = threading.Thread(target=temp_db.set_setting, args=('voice_id', 'Celeste-PlayAI'))
+    reader.start()
+    assert read_done.wait(timeout=5)
+    
+    # The write must wait for the in-flight read instead of invalidating under it
+    writer.start()
+    writer.join(timeout=0.2)
+    assert writer.is_alive()
+    
+    proceed.set()
+    reader.join(timeout=5)
+    writer.join(timeout=5)
+    
+    assert temp_db.get_setting('voice_id') == 'Celeste-PlayAI'
+
+def test_get_setting_served_from_cache(temp_db):
+    """Test that repeated reads of a setting don't query the database"""
+    temp_db.set_setting('voice_id', 'Fritz-PlayAI')
+    temp_db.get_setting('voice_id')
+    
+    with patch.object(temp_db, '_connection') as mock_connection:
+        assert temp_db.get_setting('voice_id') == 'Fritz-PlayAI'
+        mock_connection.assert_not_called()
@@ -2,8 +2,14 @@ import pytest
 from unittest.mock import patch, MagicMock
 import json
 import os
+from utils import groq_integration
 from utils.groq_integration import get_groq_response
 
+@pytest.fixture(autouse=True)
+def reset_groq_client(monkeypatch):
+    """Start every test without a cached Groq client, so patches of Groq take effect"""
+    monkeypatch.setattr(groq_integration, '_client', None)
+
 @pytest.fixture
 def mock_groq_response():
     """Fixture for mock Groq API response"""
@@ -151,4 +157,18 @@ def test_groq_response_missing_api_key():
     finally:
         # Restore original API key
         if original_key:
-            os.environ['GROQ_API_KEY'] = original_key 
\ No newline at end of file
+            os.environ['GROQ_API_KEY'] = original_key 
+
+def test_groq_client_reused_across_calls():
+    """Test that one Groq client is created and reused for every call"""
+    with patch('utils.groq_integration.Groq') as mock_groq, \
+         patch('utils.groq_integration.atexit.register') as mock_register:
+        mock_client = mock_groq.return_value
+        mock_client.chat.completions.create.return_value.choices[0].message.content = 'Test response'
+        
+        assert get_groq_response("First input") == 'Test response'
+        assert get_groq_response("Second input") == 'Test response'
+        
+        mock_groq.assert_called_once()
+        assert mock_client.chat.completions.create.call_count == 2
+        mock_register.assert_called_once_with(mock_client.close)
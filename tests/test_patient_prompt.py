@@ -0,0 +1,58 @@
+import pytest
+from unittest.mock import patch
+from utils import patient_simulation
+from utils.patient_simulation import format_patient_prompt
+
+@pytest.fixture(autouse=True)
+def clear_prompt_cache():
+    """Start every test with an empty prompt cache"""
+    patient_simulation._fill_prompt_template_cached.cache_clear()
+    yield
+    patient_simulation._fill_prompt_template_cached.cache_clear()
+
+def make_patient_data(prompt_template, **details):
+    return {"prompt_template": prompt_template, "patient_details": details}
+
+def test_format_patient_prompt():
+    """Test substituting patient details into the prompt template"""
+    patient_data = make_patient_data("A {age} year old {occupation}.", age=45, occupation="teacher")
+    
+    assert format_patient_prompt(patient_data) == "A 45 year old teacher."
+
+def test_format_patient_prompt_cached():
+    """Test that repeated formatting of the same simulation is served from the cache"""
+    patient_data = make_patient_data("Illness: {illness}", illness="flu")
+    
+    format_patient_prompt(patient_data)
+    format_patient_prompt(patient_data)
+    
+    info = patient_simulation._fill_prompt_template_cached.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+def test_format_patient_prompt_cache_keeps_value_types():
+    """Test that equal values of different types aren't served each other's prompt"""
+    prompts = [
+        format_patient_prompt(make_patient_data("Age {age}", age=value))
+        for value in (1, True, 1.0)
+    ]
+    
+    assert prompts == ["Age 1", "Age True", "Age 1.0"]
+
+def test_format_patient_prompt_unhashable_details():
+    """Test that unhashable detail values bypass the cache"""
+    patient_data = make_patient_data("History: {medical_history}", medical_history=["asthma"])
+    
+    assert format_patient_prompt(patient_data) == "History: ['asthma']"
+    assert patient_simulation._fill_prompt_template_cached.cache_info().currsize == 0
+
+def test_format_patient_prompt_format_error_not_retried():
+    """Test that formatting errors propagate instead of being retried uncached"""
+    patient_data = make_patient_data("Age: {age:d}", age=None)
+    
+    with patch.object(
+        patient_simulation, '_fill_prompt_template',
+        wraps=patient_simulation._fill_prompt_template
+    ) as mock_fill:
+        with pytest.raises(TypeError):
+            format_patient_prompt(patient_data)
+        mock_fill.assert_called_once()
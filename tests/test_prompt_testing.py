@@ -0,0 +1,126 @@
+import pytest
+import threading
+from unittest.mock import patch
+from utils import prompt_testing
+
+@pytest.fixture
+def tester(tmp_path, monkeypatch):
+    """Fixture for a PromptTester writing its results under a temporary directory"""
+    monkeypatch.chdir(tmp_path)
+    return prompt_testing.PromptTester(max_workers=8)
+
+def make_templates(*names):
+    return [
+        prompt_testing.PromptTemplate(
+            system_instruction=f"system {name}",
+            patient_profile=f"profile {name}",
+            name=name
+        )
+        for name in names
+    ]
+
+def make_test_cases(count):
+    return [
+        prompt_testing.TestCase(question=f"question {i}", expected_answer=f"answer {i}")
+        for i in range(count)
+    ]
+
+def test_run_test_suites_keeps_order_and_grouping(tester):
+    """Test that results keep test case order per template when calls finish out of order"""
+    templates = make_templates("first", "second")
+    test_cases = make_test_cases(4)
+    done = {
+        (f"system {template.name}", i): threading.Event()
+        for template in templates
+        for i in range(len(test_cases))
+    }
+    completed = {template.name: [] for template in templates}
+    lock = threading.Lock()
+    
+    def reversed_response(input_text, model, system_prompt):
+        # Each question waits for the next one, so the last question finishes first
+        index = int(input_text.rsplit(" ", 1)[-1])
+        if index + 1 < len(test_cases):
+            assert done[(system_prompt, index + 1)].wait(timeout=5)
+        with lock:
+            completed[system_prompt.split(" ", 1)[1]].append(index)
+        done[(system_prompt, index)].set()
+        return f"{system_prompt} / {input_text.splitlines()[-1]}"
+    
+    with patch('utils.prompt_testing.get_groq_response', side_effect=reversed_response):
+        results = tester.run_test_suites(templates, test_cases)
+    
+    # Calls really did complete in reverse submission order
+    assert completed == {"first": [3, 2, 1, 0], "second": [3, 2, 1, 0]}
+    
+    assert list(results) == ["first", "second"]
+    for template in templates:
+        assert [r["template_name"] for r in results[template.name]] == [template.name] * 4
+        assert [r["question"] for r in results[template.name]] == [
+            f"question {i}" for i in range(4)
+        ]
+        assert [r["actual_response"] for r in results[template.name]] == [
+            f"system {template.name} / Question: question {i}" for i in range(4)
+        ]
+
+def test_iter_test_suites_yields_templates_as_they_finish(tester):
+    """Test that a finished template is yielded while another is still running"""
+    templates = make_templates("slow", "fast")
+    release_slow = threading.Event()
+    
+    def response(input_text, model, system_prompt):
+        if system_prompt == "system slow":
+            assert release_slow.wait(timeout=5)
+        return "response"
+    
+    with patch('utils.prompt_testing.get_groq_response', side_effect=response):
+        suites = tester.iter_test_suites(templates, make_test_cases(2))
+        
+        template, results = next(suites)
+        assert template.name == "fast"
+        assert len(results) == 2
+        
+        release_slow.set()
+        template, results = next(suites)
+        assert template.name == "slow"
+        assert next(suites, None) is None
+
+def test_iter_test_suites_failure_keeps_finished_templates(tester):
+    """Test that one failing test case doesn't discard templates that already finished"""
+    templates = make_templates("failing", "passing")
+    release_failing = threading.Event()
+    
+    def response(input_text, model, system_prompt):
+        if system_prompt == "system failing":
+            assert release_failing.wait(timeout=5)
+            raise RuntimeError("API down")
+        return "response"
+    
+    with patch('utils.prompt_testing.get_groq_response', side_effect=response):
+        suites = tester.iter_test_suites(templates, make_test_cases(2))
+        
+        template, _ = next(suites)
+        assert template.name == "passing"
+        
+        release_failing.set()
+        with pytest.raises(RuntimeError):
+            next(suites)
+
+def test_run_test_suite_single_template(tester):
+    """Test that a single-template suite returns one result per test case, in order"""
+    template, = make_templates("only")
+    test_cases = make_test_cases(3)
+    
+    with patch('utils.prompt_testing.get_groq_response', return_value="response"):
+        results = tester.run_test_suite(template, test_cases)
+    
+    assert [r["question"] for r in results] == ["question 0", "question 1", "question 2"]
+
+def test_run_test_suites_rejects_duplicate_names(tester):
+    """Test that templates sharing a name are rejected instead of merged"""
+    templates = make_templates("same", "same")
+    
+    with patch('utils.prompt_testing.get_groq_response') as mock_response:
+        with pytest.raises(ValueError):
+            tester.run_test_suites(templates, make_test_cases(2))
+        mock_response.assert_not_called()
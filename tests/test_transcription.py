@@ -18,7 +18,7 @@ def mock_transcription_response():
 
 def test_audio_transcription(mock_audio_data, mock_transcription_response):
     """Test successful audio transcription"""
-    with patch('utils.groq_transcribe.requests.post') as mock_post:
+    with patch('utils.groq_transcribe._session.post') as mock_post:
         # Configure mock
         mock_post.return_value.status_code = 200
         mock_post.return_value.json.return_value = mock_transcription_response
@@ -32,7 +32,7 @@ def test_audio_transcription(mock_audio_data, mock_transcription_response):
 
 def test_transcription_error_handling(mock_audio_data):
     """Test transcription error handling"""
-    with patch('utils.groq_transcribe.requests.post') as mock_post:
+    with patch('utils.groq_transcribe._session.post') as mock_post:
         # Configure mock for error
         mock_post.return_value.status_code = 500
         mock_post.return_value.text = "API Error"
@@ -46,7 +46,7 @@ def test_transcription_error_handling(mock_audio_data):
 
 def test_transcription_network_error(mock_audio_data):
     """Test network error handling"""
-    with patch('utils.groq_transcribe.requests.post') as mock_post:
+    with patch('utils.groq_transcribe._session.post') as mock_post:
         # Configure mock for network error
         mock_post.side_effect = Exception("Network error")
         
@@ -106,7 +106,7 @@ def test_transcription_with_different_models(mock_audio_data, mock_transcription
     ]
     
     for model in models:
-        with patch('utils.groq_transcribe.requests.post') as mock_post:
+        with patch('utils.groq_transcribe._session.post') as mock_post:
             # Configure mock
             mock_post.return_value.status_code = 200
             mock_post.return_value.json.return_value = mock_transcription_response
@@ -19,7 +19,7 @@ def mock_error_response():
 
 def test_speech_generation(mock_audio_response):
     """Test successful text-to-speech generation"""
-    with patch('utils.groq_tts_speech.requests.post') as mock_post:
+    with patch('utils.groq_tts_speech._session.post') as mock_post:
         # Configure mock
         mock_post.return_value.status_code = 200
         mock_post.return_value.content = mock_audio_response
@@ -35,7 +35,7 @@ def test_speech_generation_with_voice(mock_audio_response):
     """Test text-to-speech generation with specific voice"""
     voice_id = "custom-voice"
     
-    with patch('utils.groq_tts_speech.requests.post') as mock_post:
+    with patch('utils.groq_tts_speech._session.post') as mock_post:
         # Configure mock
         mock_post.return_value.status_code = 200
         mock_post.return_value.content = mock_audio_response
@@ -53,7 +53,7 @@ def test_speech_generation_with_voice(mock_audio_response):
 
 def test_tts_error_handling(mock_error_response):
     """Test error handling in text-to-speech generation"""
-    with patch('utils.groq_tts_speech.requests.post') as mock_post:
+    with patch('utils.groq_tts_speech._session.post') as mock_post:
         # Configure mock for error
         mock_post.return_value.status_code = 500
         mock_post.return_value.json.return_value = mock_error_response
@@ -67,7 +67,7 @@ def test_tts_error_handling(mock_error_response):
 
 def test_tts_network_error():
     """Test network error handling"""
-    with patch('utils.groq_tts_speech.requests.post') as mock_post:
+    with patch('utils.groq_tts_speech._session.post') as mock_post:
         # Configure mock for network error
         mock_post.side_effect = Exception("Network error")
         
@@ -101,7 +101,7 @@ def test_tts_missing_api_key():
 
 def test_tts_empty_text():
     """Test handling of empty text input"""
-    with patch('utils.groq_tts_speech.requests.post') as mock_post:
+    with patch('utils.groq_tts_speech._session.post') as mock_post:
         # Test empty text handling
         audio_data = generate_speech_audio("")
         
@@ -113,7 +113,7 @@ def test_tts_long_text(mock_audio_response):
     """Test handling of long text input"""
     long_text = "Test text " * 1000  # Create a long text
     
-    with patch('utils.groq_tts_speech.requests.post') as mock_post:
+    with patch('utils.groq_tts_speech._session.post') as mock_post:
         # Configure mock
         mock_post.return_value.status_code = 200
         mock_post.return_value.content = mock_audio_response
@@ -1,32 +1,89 @@
 import sqlite3
 import json
-from datetime import datetime
+import queue
+import threading
+from contextlib import contextmanager
 import os
 
+# Marks a settings key that isn't cached yet; a cached row may itself be None
+_MISSING = object()
+
+# Canonical role strings, so loaded messages share one object per role
+_ROLE_NAMES = {role: role for role in ('user', 'assistant', 'system')}
+
 class ConversationDatabase:
-    def __init__(self, db_path='conversations.db'):
-        """Initialize the database connection"""
+    def __init__(self, db_path='conversations.db', pool_size=8):
+        """Initialize the database connection pool"""
         self.db_path = db_path
+        # Idle connections kept open for reuse instead of reconnecting on every call
+        self._pool = queue.LifoQueue(maxsize=pool_size)
+        # Settings rows by key; read on every conversation turn but rarely written.
+        # Only set_setting on this instance invalidates it, so this assumes one
+        # process writes settings (a single gunicorn worker, WEB_CONCURRENCY=1)
+        self._settings_cache = {}
+        self._settings_lock = threading.Lock()
         self._create_tables()
     
+    def _connect(self):
+        """Open a new connection that pooled callers can share between threads"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        # WAL only needs a full fsync at checkpoints, so NORMAL is still crash-safe
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+    
+    @contextmanager
+    def _connection(self):
+        """
+        Borrow a pooled connection for one transaction.
+        
+        Commits when the block succeeds and rolls back if it raises, then
+        returns the connection to the pool.
+        """
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
+        
+        try:
+            with conn:
+                yield conn
+        finally:
+            try:
+                self._pool.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+    
+    def close(self):
+        """Close all idle pooled connections"""
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+    
     def _create_tables(self):
         """Create necessary database tables if they don't exist"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.cursor()
             
-            # Create conversations table
-            cursor.execute('''
+            # Write-ahead logging lets readers run alongside a writer; the mode
+            # is stored in the database file, so it only has to be set once. The
+            # pragma returns the new mode; read it so the statement is finished
+            # before the schema script commits
+            cursor.execute('PRAGMA journal_mode=WAL').fetchone()
+            
+            # Create tables and indexes in one batch and one transaction
+            cursor.executescript('''
+                BEGIN;
+                
                 CREATE TABLE IF NOT EXISTS conversations (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     patient_simulation TEXT,
                     start_time TIMESTAMP,
                     end_time TIMESTAMP,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            # Create messages table
-            cursor.execute('''
+                );
+                
                 CREATE TABLE IF NOT EXISTS messages (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     conversation_id INTEGER,
@@ -34,71 +91,84 @@ class ConversationDatabase:
                     content TEXT,
                     timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     FOREIGN KEY (conversation_id) REFERENCES conversations (id)
-                )
-            ''')
-            
-            # Create settings table
-            cursor.execute('''
+                );
+                
+                -- Index messages by conversation so fetching a conversation's
+                -- messages in order doesn't scan the whole table
+                CREATE INDEX IF NOT EXISTS idx_messages_conversation
+                ON messages (conversation_id, timestamp);
+                
+                -- Lets the newest-first conversation listing read rows in index
+                -- order and stop after a page instead of sorting the whole table
+                CREATE INDEX IF NOT EXISTS idx_conversations_created
+                ON conversations (created_at DESC, id DESC);
+                
                 CREATE TABLE IF NOT EXISTS settings (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     key TEXT UNIQUE,
                     value TEXT,
                     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
+                );
+                
+                COMMIT;
             ''')
-            
-            conn.commit()
     
     def start_conversation(self, patient_simulation=None):
         """Start a new conversation and return its ID"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
-                'INSERT INTO conversations (patient_simulation, start_time) VALUES (?, ?)',
-                (patient_simulation, datetime.now())
+                'INSERT INTO conversations (patient_simulation, start_time) '
+                'VALUES (?, CURRENT_TIMESTAMP)',
+                (patient_simulation,)
             )
             conn.commit()
             return cursor.lastrowid
     
     def end_conversation(self, conversation_id):
         """Mark a conversation as ended"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
-                'UPDATE conversations SET end_time = ? WHERE id = ?',
-                (datetime.now(), conversation_id)
+                'UPDATE conversations SET end_time = CURRENT_TIMESTAMP WHERE id = ?',
+                (conversation_id,)
             )
             conn.commit()
     
     def add_message(self, conversation_id, role, content):
         """Add a message to a conversation"""
-        with sqlite3.connect(self.db_path) as conn:
+        self.add_messages(conversation_id, [(role, content)])
+    
+    def add_messages(self, conversation_id, messages):
+        """Add a sequence of (role, content) messages to a conversation in one transaction"""
+        with self._connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(
+            cursor.executemany(
                 'INSERT INTO messages (conversation_id, role, content) VALUES (?, ?, ?)',
-                (conversation_id, role, content)
+                [(conversation_id, role, content) for role, content in messages]
             )
             conn.commit()
     
     def get_conversation(self, conversation_id):
         """Get a conversation with all its messages"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.cursor()
             
-            # Get conversation details
-            cursor.execute('SELECT * FROM conversations WHERE id = ?', (conversation_id,))
-            conversation = cursor.fetchone()
-            
-            if not conversation:
-                return None
-            
-            # Get all messages for this conversation
+            # Get conversation details and its messages in one query; a conversation
+            # without messages still yields one row, with NULL message columns
             cursor.execute(
-                'SELECT role, content, timestamp FROM messages WHERE conversation_id = ? ORDER BY timestamp',
+                'SELECT c.id, c.patient_simulation, c.start_time, c.end_time, c.created_at, '
+                'm.id, m.role, m.content, m.timestamp '
+                'FROM conversations c LEFT JOIN messages m ON m.conversation_id = c.id '
+                'WHERE c.id = ? ORDER BY m.timestamp, m.id',
                 (conversation_id,)
             )
-            messages = cursor.fetchall()
+            rows = cursor.fetchall()
             
+            if not rows:
+                return None
+            
+            conversation = rows[0]
             return {
                 'id': conversation[0],
                 'patient_simulation': conversation[1],
@@ -106,21 +176,25 @@ class ConversationDatabase:
                 'end_time': conversation[3],
                 'created_at': conversation[4],
                 'messages': [
-                    {'role': msg[0], 'content': msg[1], 'timestamp': msg[2]}
-                    for msg in messages
+                    {'role': _ROLE_NAMES.get(row[6], row[6]), 'content': row[7], 'timestamp': row[8]}
+                    for row in rows if row[5] is not None
                 ]
             }
     
-    def get_all_conversations(self):
-        """Get all conversations"""
-        with sqlite3.connect(self.db_path) as conn:
+    def get_all_conversations(self, limit=None, offset=0):
+        """Get conversations, most recent first, optionally one page at a time"""
+        with self._connection() as conn:
             cursor = conn.cursor()
-            cursor.execute('SELECT * FROM conversations ORDER BY created_at DESC')
+            # LIMIT -1 means no limit in SQLite; id breaks ties within the same second
+            cursor.execute(
+                'SELECT * FROM conversations ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?',
+                (-1 if limit is None else limit, offset)
+            )
             return cursor.fetchall()
     
     def delete_conversation(self, conversation_id):
         """Delete a conversation and all its messages"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.cursor()
             cursor.execute('DELETE FROM messages WHERE conversation_id = ?', (conversation_id,))
             cursor.execute('DELETE FROM conversations WHERE id = ?', (conversation_id,))
@@ -128,23 +202,33 @@ class ConversationDatabase:
             
     def get_setting(self, key, default_value=None):
         """Get a setting value by key"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('SELECT value FROM settings WHERE key = ?', (key,))
-            result = cursor.fetchone()
-            
-            if result:
-                return result[0]
-            return default_value
+        # A single lookup, so a concurrent set_setting can't evict the key between
+        # checking for it and reading it
+        result = self._settings_cache.get(key, _MISSING)
+        if result is _MISSING:
+            # Held so a concurrent set_setting can't be overwritten with a stale read
+            with self._settings_lock, self._connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT value FROM settings WHERE key = ?', (key,))
+                result = cursor.fetchone()
+                self._settings_cache[key] = result
+        
+        if result:
+            return result[0]
+        return default_value
     
     def set_setting(self, key, value):
         """Set a setting value by key"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                'INSERT INTO settings (key, value, updated_at) VALUES (?, ?, ?) '
-                'ON CONFLICT(key) DO UPDATE SET value = ?, updated_at = ?',
-                (key, value, datetime.now(), value, datetime.now())
-            )
-            conn.commit()
-            return True 
\ No newline at end of file
+        with self._settings_lock:
+            with self._connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    'INSERT INTO settings (key, value, updated_at) VALUES (?, ?, CURRENT_TIMESTAMP) '
+                    'ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated_at = CURRENT_TIMESTAMP',
+                    (key, value)
+                )
+                conn.commit()
+            
+            # Re-read from the database next time, as stored
+            self._settings_cache.pop(key, None)
+        return True
\ No newline at end of file
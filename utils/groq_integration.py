@@ -1,12 +1,47 @@
 import os
 import sys
 import json
+import atexit
+import threading
 import traceback
 from groq import Groq
 from dotenv import load_dotenv
 
 load_dotenv()
 
+DEFAULT_SYSTEM_PROMPT = "You are a helpful assistant. Respond concisely to the user's input."
+
+# Retries for connection errors, timeouts and 408/409/429/5xx responses, with
+# exponential backoff and jitter. This only pins the Groq SDK's own default of 2
+# (three attempts in total). Chat completion POSTs are retried too, so a request
+# that timed out after reaching the server may run twice.
+GROQ_MAX_RETRIES = 2
+
+# Shared Groq client, created on first use so its connection pool is reused across calls
+_client = None
+_client_lock = threading.Lock()
+
+def _get_groq_client(api_key):
+    """
+    Return the shared Groq client, creating it on first use.
+    
+    Args:
+        api_key (str): Groq API key used if the client has to be created
+        
+    Returns:
+        Groq: The shared Groq client
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                # Explicitly avoid proxy settings by using only the api_key parameter
+                _client = Groq(api_key=api_key, max_retries=GROQ_MAX_RETRIES)
+                # Close pooled connections when the process exits
+                atexit.register(_client.close)
+                print("Groq client initialized successfully")
+    return _client
+
 def get_groq_response(input_text, model="llama3-8b-8192", history=None, system_prompt=None):
     """
     Get a response from Groq LLM with conversation history support.
@@ -34,20 +69,16 @@ def get_groq_response(input_text, model="llama3-8b-8192", history=None, system_p
         # Debug: Print incoming history
         print(f"Processing request with {len(history)} previous messages")
         
-        # Initialize Groq client - explicitly use only api_key
+        # Get the shared Groq client
         try:
-            # Explicitly avoid proxy settings by using only the api_key parameter
-            client = Groq(api_key=api_key)
-            # Test the client with a simple call to ensure it works
-            print("Groq client initialized successfully")
+            client = _get_groq_client(api_key)
         except Exception as client_error:
             print(f"Error initializing Groq client: {client_error}")
             traceback.print_exc()  # Print full traceback for debugging
             return f"Error: Unable to initialize Groq client: {str(client_error)}"
         
         # Construct messages list with custom system prompt if provided
-        default_system_prompt = "You are a helpful assistant. Respond concisely to the user's input."
-        messages = [{"role": "system", "content": system_prompt or default_system_prompt}]
+        messages = [{"role": "system", "content": system_prompt or DEFAULT_SYSTEM_PROMPT}]
         messages.extend(history)
         messages.append({"role": "user", "content": input_text})
         
@@ -1,4 +1,5 @@
 import os
+import atexit
 import tempfile
 import wave
 import numpy as np
@@ -7,6 +8,13 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# Shared HTTP session so connections to the Groq API are kept alive between requests.
+# Flask's request threads share it, so only stateless POSTs go through it: headers
+# are passed per call and nothing is set on the session itself
+_session = requests.Session()
+# Close pooled connections when the process exits
+atexit.register(_session.close)
+
 def transcribe_audio_data(audio_bytes, model="whisper-large-v3-turbo"):
     """
     Transcribe audio data using Groq API.
@@ -46,7 +54,7 @@ def transcribe_audio_data(audio_bytes, model="whisper-large-v3-turbo"):
             }
             
             # Make the API request
-            response = requests.post(url, headers=headers, files=files)
+            response = _session.post(url, headers=headers, files=files)
             
             # Check for successful response
             if response.status_code == 200:
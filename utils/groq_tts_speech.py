@@ -1,4 +1,5 @@
 import os
+import atexit
 import tempfile
 import requests
 import json
@@ -6,6 +7,13 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# Shared HTTP session so connections to the Groq API are kept alive between requests.
+# Flask's request threads share it, so only stateless POSTs go through it: headers
+# are passed per call and nothing is set on the session itself
+_session = requests.Session()
+# Close pooled connections when the process exits
+atexit.register(_session.close)
+
 def generate_speech_audio(text, voice_id="Fritz-PlayAI"):
     """
     Convert text to speech using Groq API and return audio bytes.
@@ -42,7 +50,7 @@ def generate_speech_audio(text, voice_id="Fritz-PlayAI"):
         }
         
         # Make the API request
-        response = requests.post(url, headers=headers, json=payload)
+        response = _session.post(url, headers=headers, json=payload)
         
         # Check for successful response
         if response.status_code == 200:
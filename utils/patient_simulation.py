@@ -1,6 +1,31 @@
 import json
 import os
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+# Patient detail fields substituted into a simulation's prompt template
+PATIENT_DETAIL_FIELDS = (
+    "age",
+    "gender",
+    "occupation",
+    "medical_history",
+    "illness",
+    "recent_exposure"
+)
+
+def _fill_prompt_template(prompt_template: str, detail_values: Tuple) -> str:
+    """Substitute detail values, ordered as PATIENT_DETAIL_FIELDS, into the template."""
+    return prompt_template.format_map(dict(zip(PATIENT_DETAIL_FIELDS, detail_values)))
+
+@lru_cache(maxsize=32)
+def _fill_prompt_template_cached(prompt_template: str, typed_values: Tuple) -> str:
+    """Cached _fill_prompt_template, keyed on (type, value) pairs.
+
+    The same simulation is formatted on every conversation turn. Keeping each
+    value's type in the key stops equal values such as 1, True and 1.0 from
+    sharing one cached prompt.
+    """
+    return _fill_prompt_template(prompt_template, tuple(value for _, value in typed_values))
 
 def load_patient_simulation(file_path: str) -> Dict:
     """
@@ -36,16 +61,14 @@ def format_patient_prompt(patient_data: Dict) -> str:
     patient_details = patient_data.get("patient_details", {})
     
     # Format the prompt template with patient details
-    formatted_prompt = prompt_template.format(
-        age=patient_details.get("age", ""),
-        gender=patient_details.get("gender", ""),
-        occupation=patient_details.get("occupation", ""),
-        medical_history=patient_details.get("medical_history", ""),
-        illness=patient_details.get("illness", ""),
-        recent_exposure=patient_details.get("recent_exposure", "")
-    )
-    
-    return formatted_prompt
+    detail_values = tuple(patient_details.get(field, "") for field in PATIENT_DETAIL_FIELDS)
+    typed_values = tuple((type(value), value) for value in detail_values)
+    try:
+        hash(typed_values)
+    except TypeError:
+        # Unhashable detail values (e.g. lists) can't be cached
+        return _fill_prompt_template(prompt_template, detail_values)
+    return _fill_prompt_template_cached(prompt_template, typed_values)
 
 def get_patient_system_prompt(patient_data: Dict) -> str:
     """
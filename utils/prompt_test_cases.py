@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Tuple
 from .prompt_testing import TestCase, PromptTemplate
 
 # Test Cases for General Medical Assessment
@@ -89,19 +89,24 @@ CHRONIC_CONDITION_TEMPLATE = PromptTemplate(
     Current medications: Metformin 1000mg twice daily, Glipizide 5mg daily."""
 )
 
+# All test cases and templates, built once as read-only tuples
+ALL_TEST_CASES: Tuple[TestCase, ...] = tuple(
+    GENERAL_MEDICAL_TEST_CASES +
+    EMERGENCY_TEST_CASES +
+    CHRONIC_CONDITION_TEST_CASES
+)
+
+ALL_TEMPLATES: Tuple[PromptTemplate, ...] = (
+    GENERAL_MEDICAL_TEMPLATE,
+    EMERGENCY_TEMPLATE,
+    CHRONIC_CONDITION_TEMPLATE
+)
+
 # Function to get all test cases and templates
-def get_all_test_cases() -> List[TestCase]:
+def get_all_test_cases() -> Tuple[TestCase, ...]:
     """Return all test cases combined."""
-    return (
-        GENERAL_MEDICAL_TEST_CASES +
-        EMERGENCY_TEST_CASES +
-        CHRONIC_CONDITION_TEST_CASES
-    )
+    return ALL_TEST_CASES
 
-def get_all_templates() -> List[PromptTemplate]:
+def get_all_templates() -> Tuple[PromptTemplate, ...]:
     """Return all prompt templates."""
-    return [
-        GENERAL_MEDICAL_TEMPLATE,
-        EMERGENCY_TEMPLATE,
-        CHRONIC_CONDITION_TEMPLATE
-    ] 
\ No newline at end of file
+    return ALL_TEMPLATES
\ No newline at end of file
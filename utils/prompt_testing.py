@@ -1,8 +1,9 @@
 from dataclasses import dataclass
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional, Sequence, Tuple
 import json
 from datetime import datetime
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from .groq_integration import get_groq_response
 
 @dataclass
@@ -22,8 +23,9 @@ class PromptTemplate:
 class PromptTester:
     """Class to handle prompt testing and evaluation."""
     
-    def __init__(self, model: str = "llama3-8b-8192"):
+    def __init__(self, model: str = "llama3-8b-8192", max_workers: int = 8):
         self.model = model
+        self.max_workers = max_workers
         self.results_dir = "prompt_test_results"
         os.makedirs(self.results_dir, exist_ok=True)
     
@@ -52,17 +54,72 @@ Question: {question}"""
             "context": test_case.context
         }
     
-    def run_test_suite(self, template: PromptTemplate, test_cases: List[TestCase]) -> List[Dict]:
-        """Run a suite of test cases for a given template."""
-        results = []
-        for test_case in test_cases:
-            result = self.run_test_case(template, test_case)
-            results.append(result)
-        return results
+    def run_test_suite(self, template: PromptTemplate, test_cases: Sequence[TestCase]) -> List[Dict]:
+        """Run a suite of test cases for a given template.
+
+        Test cases are sent to the LLM concurrently; results are returned
+        in the same order as test_cases.
+        """
+        return self.run_test_suites([template], test_cases)[template.name]
+    
+    def run_test_suites(self, templates: Sequence[PromptTemplate], test_cases: Sequence[TestCase]) -> Dict[str, List[Dict]]:
+        """Run a suite of test cases for each template.
+
+        All (template, test case) pairs share one thread pool, so the
+        templates are tested concurrently. Results are keyed by template
+        name, each list in the same order as test_cases; template names
+        must therefore be unique.
+        """
+        results = {
+            template.name: template_results
+            for template, template_results in self.iter_test_suites(templates, test_cases)
+        }
+        return {template.name: results[template.name] for template in templates}
+    
+    def iter_test_suites(self, templates: Sequence[PromptTemplate],
+                         test_cases: Sequence[TestCase]) -> Iterator[Tuple[PromptTemplate, List[Dict]]]:
+        """Run test suites concurrently, yielding (template, results) as each template finishes.
+
+        Templates are yielded in completion order, each results list in the
+        same order as test_cases. A failing test case raises when its
+        template is reached, after earlier finished templates were yielded;
+        test cases that haven't started yet are then cancelled.
+        """
+        names = [template.name for template in templates]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Template names must be unique, got: {names}")
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            template_futures = [
+                [executor.submit(self.run_test_case, template, test_case) for test_case in test_cases]
+                for template in templates
+            ]
+            template_index = {
+                future: index
+                for index, futures in enumerate(template_futures)
+                for future in futures
+            }
+            remaining = [len(futures) for futures in template_futures]
+            
+            try:
+                for index, futures in enumerate(template_futures):
+                    if not futures:
+                        yield templates[index], []
+                
+                for future in as_completed(template_index):
+                    index = template_index[future]
+                    remaining[index] -= 1
+                    if remaining[index] == 0:
+                        yield templates[index], [f.result() for f in template_futures[index]]
+            finally:
+                # Don't keep calling the LLM for a run that failed or was abandoned
+                for future in template_index:
+                    future.cancel()
     
-    def save_results(self, results: List[Dict], template_name: str):
-        """Save test results to a JSON file."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    def save_results(self, results: List[Dict], template_name: str, timestamp: Optional[str] = None):
+        """Save test results to a JSON file, stamped with timestamp or the current time."""
+        if timestamp is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"{self.results_dir}/{template_name}_{timestamp}.json"
         
         with open(filename, 'w') as f:
@@ -57,19 +57,21 @@ def main():
     test_cases = get_all_test_cases()
     templates = get_all_templates()
     
-    # Run tests for each template
+    # One timestamp for every file written by this run
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    
+    # Run tests for all templates concurrently, saving each template's
+    # results as soon as it finishes so a later failure doesn't lose them
     all_results = []
-    for template in templates:
-        print(f"\nTesting template: {template.name}")
-        results = tester.run_test_suite(template, test_cases)
+    for template, results in tester.iter_test_suites(templates, test_cases):
+        print(f"\nTested template: {template.name}")
         all_results.extend(results)
         
         # Save individual template results
-        saved_file = tester.save_results(results, template.name)
+        saved_file = tester.save_results(results, template.name, timestamp)
         print(f"Results saved to: {saved_file}")
     
     # Analyze all results
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     analysis = analyzer.analyze_results(all_results)
     analysis_file = analyzer.save_analysis(analysis, timestamp)
     